@@ -1,7 +1,12 @@
-from collections import defaultdict, UserDict
-from datetime import datetime, timedelta
+import functools
+import re
+import sys
+import weakref
+from datetime import date, timedelta
 
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -9,135 +14,164 @@ class Field:
         return str(self.value)
 
 class Name(Field):
-    def __init__(self, value):
-        super().__init__(value)
+    __slots__ = ()
 
-class Phone(Field):
     def __init__(self, value):
-        super().__init__(value)
-        self.__value = None
-        self.value = value
+        super().__init__(sys.intern(value))
 
-    @property
-    def value(self):
-        return self.__value
+_ONE_DAY = timedelta(days=1)
 
-    @value.setter
-    def value(self, value):
-        if  len(value[1:]) <= 15 and value[1:].isdigit():
-            self.__value = value
-        else:
-            raise ValueError('Wrong telephone number')
+_PHONE_RE_MATCH = re.compile(r"\A\d{10}\Z").match
+
+def _validate_phone(phone):
+    if _PHONE_RE_MATCH(phone) is None:
+        raise ValueError('Invalid phone number')
+
+def _parse_ddmmyyyy(value):
+    if len(value) != 10 or value[2] != '.' or value[5] != '.':
+        raise ValueError("Wrong date, expected DD.MM.YYYY")
+    try:
+        return date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+    except ValueError:
+        raise ValueError("Wrong date, expected DD.MM.YYYY")
 
 class Birthday(Field):
+    __slots__ = ("date",)
+
     def __init__(self, value):
-        try:
-            self.date = datetime.strptime(value, "%d.%m.%Y").date()
-            super().__init__(value)
-        except ValueError:
-            raise ValueError("Wrong date, expected DD.MM.YYYY")
+        self.date = _parse_ddmmyyyy(value)
+        self.value = value
         
 class Record:
+    __slots__ = ("name", "phones", "birthday", "_book", "_str")
+
     def __init__(self, name):
         self.name = Name(name)
-        self.phones = []
+        self.phones: dict[str, None] = {}
         self.birthday = None
+        self._book = None
+        self._str = None
 
     def add_phone(self, phone):
-        try:
-            phone = Phone(phone)
-            self.phones.append(phone)
-        except ValueError as i:
-            raise ValueError(f"Error adding phone: {i}")
+        _validate_phone(phone)
+        self.phones[phone] = None
+        self._str = None
 
     def remove_phone(self, phone):
-        for p in self.phones:
-            if p.value == phone:
-                self.phones.remove(p)
-                return
-        raise ValueError("Phone number not found in record.")
+        try:
+            del self.phones[phone]
+        except KeyError:
+            raise ValueError("Phone number not found in record.")
+        self._str = None
 
     def edit_phone(self, old_phone, new_phone):
-        for p in self.phones:
-            if p.value == old_phone:
-                try:
-                    new_phone = Phone(new_phone)
-                except ValueError as i:
-                    raise ValueError(f"Error: {i}")
-                p.value = new_phone.value
-                return
-        raise ValueError("Phone number not found in record.")
+        if old_phone not in self.phones:
+            raise ValueError("Phone number not found in record.")
+        _validate_phone(new_phone)
+        del self.phones[old_phone]
+        self.phones[new_phone] = None
+        self._str = None
 
     def find_phone(self, phone):
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        return phone if phone in self.phones else None
 
     def add_birthday(self, birthday):
         try:
             self.birthday = Birthday(birthday)
         except ValueError as e:
             raise ValueError(f"Error adding birthday: {e}")
+        self._str = None
+        book = self._book() if self._book is not None else None
+        if book is not None:
+            book._invalidate_bday_index()
 
     def __str__(self):
-        phones_str = ', '.join(str(phone.value) for phone in self.phones)
-        return f"Contact name: {self.name.value}, phones: {phones_str}, birthday: {self.birthday.value if self.birthday else None}"
+        if self._str is None:
+            phones_str = "; ".join(self.phones)
+            self._str = f"Contact name: {self.name.value}, phones: {phones_str}, birthday: {self.birthday.value if self.birthday else None}"
+        return self._str
 
 
-class AddressBook(UserDict):
+class AddressBook(dict):
+    __slots__ = ("_bday_index", "_version", "_cache", "__weakref__")
+
+    def __init__(self):
+        super().__init__()
+        self._bday_index = None
+        self._version = 0
+        self._cache = None
+
     def add_record(self, record):
-        self.data[record.name.value] = record
+        record._book = weakref.ref(self)
+        self[record.name.value] = record
+        self._invalidate_bday_index()
 
-    def find(self, name):
-        return self.data.get(name)
+    find = dict.get
 
     def delete(self, name):
-        del self.data[name]
-
-    def find_next_weekday(self, day,weekday: int):
-        days_ahead = weekday - day.weekday()
-        if days_ahead <= 0:
-            days_ahead += 7
-            next_weekday = day + timedelta(days = days_ahead)
-            if next_weekday.weekday() in [5,6]:
-                next_weekday = next_weekday + timedelta(days = (7 - next_weekday.weekday()))
-            return next_weekday
-        
+        del self[name]
+        self._invalidate_bday_index()
+
+    def _invalidate_bday_index(self):
+        self._bday_index = None
+        self._version += 1
+
+    def _build_bday_index(self):
+        index = {}
+        for name, record in self.items():
+            birthday = record.birthday
+            if birthday:
+                bd = birthday.date
+                index.setdefault(bd.month * 100 + bd.day, []).append(name)
+        self._bday_index = index
+        return index
+
+    def find_next_weekday(self, day):
+        wd = day.weekday()
+        shift = (7 - wd) & -(wd >= 5)
+        return day + timedelta(days=shift) if shift else day
+
     def get_upcoming_birthdays(self, days=7):
+        today = date.today()
+        cache = self._cache
+        if cache is not None and cache[:3] == (today, days, self._version):
+            return cache[3]
+        index = self._bday_index
+        if index is None:
+            index = self._build_bday_index()
         upcoming_birthdays = []
-        current_date = datetime.today().date()
-        next_week = current_date + timedelta(weeks=1)
-        for record in self.values():
-            if record.birthday:
-                next_birthday = record.birthday.date.replace(year=current_date.year)
-                if current_date <= next_birthday <= next_week:
-                    if next_birthday.weekday() in [5,6]:
-                        next_birthday = self.find_next_weekday(next_birthday, 0)
-                    upcoming_birthdays.append(f"{record.name.value}: {next_birthday.strftime("%d,%m,%Y")}")
-                elif current_date > next_birthday:
-                    next_birthday = record.birthday.date.replace(year=current_date.year + 1)
-                    if current_date <= next_birthday <= next_week:
-                        if next_birthday.weekday() in [5,6]:
-                            next_birthday = self.find_next_weekday(next_birthday, 0)
-                        upcoming_birthdays.append(f"{record.name.value}: {next_birthday.strftime("%d,%m,%Y")}")
+        day = today
+        for _ in range(days + 1):
+            names = index.get(day.month * 100 + day.day)
+            if names:
+                wd = day.weekday()
+                shift = 0 if wd < 5 else 7 - wd
+                congrats_day = day + timedelta(days=shift) if shift else day
+                stamp = congrats_day.strftime('%d,%m,%Y')
+                for name in names:
+                    upcoming_birthdays.append(f"{name}: {stamp}")
+            day += _ONE_DAY
+        self._cache = (today, days, self._version, upcoming_birthdays)
         return upcoming_birthdays
 
 
 def input_error(func):
+    @functools.wraps(func)
     def inner(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except Exception as e:
+        except (KeyError, ValueError, IndexError) as e:
             return str(e)
     return inner
 
 @input_error
 def add_contact(args, book: AddressBook):
-    if len(args) != 2:
-        raise KeyError('Expected Name and Phone number')
-    name, phone, *_ = args
-    record = book.find(name)
+    try:
+        name, phone = args
+    except ValueError:
+        raise ValueError('Expected Name and Phone number')
+    name = sys.intern(name)
+    record = book.get(name)
     message = "Contact updated."
     if record is None:
         record = Record(name)
@@ -149,10 +183,12 @@ def add_contact(args, book: AddressBook):
 
 @input_error
 def change_contact(args, book: AddressBook):
-    if len(args) != 3:
-        raise KeyError(' Wrong arguments, expected - Name, OldNumber, NewNumber')
-    name, old_phone, new_phone, *_ = args
-    record = book.find(name)
+    try:
+        name, old_phone, new_phone = args
+    except ValueError:
+        raise ValueError('Wrong arguments, expected - Name, OldNumber, NewNumber')
+    name = sys.intern(name)
+    record = book.get(name)
     if record is None:
         raise ValueError("Name not found")
     record.edit_phone(old_phone, new_phone)
@@ -160,23 +196,25 @@ def change_contact(args, book: AddressBook):
 
 @input_error
 def show_phones(args, book: AddressBook):
-    if len(args) != 1:
-        raise KeyError('Expected Name')
-    name, *_ = args
-    record = book.find(name)
+    try:
+        name, = args
+    except ValueError:
+        raise ValueError('Expected Name')
+    name = sys.intern(name)
+    record = book.get(name)
     if record is None:
         raise ValueError("Name not found")
-    return [p.value for p in record.phones]
+    return list(record.phones)
 
-@input_error
 def show_all(book: AddressBook):
-    return '\n'.join(str(record) for record in book.data.values())
+    return '\n'.join([str(record) for record in book.values()])
 
 
 @input_error
 def add_birthday(args, book: AddressBook):
     name, birthday = args
-    contact = book.find(name)
+    name = sys.intern(name)
+    contact = book.get(name)
     if contact:
         contact.add_birthday(birthday)
         return f"Birthday added for {name}"
@@ -190,11 +228,13 @@ def add_birthday(args, book: AddressBook):
 @input_error
 def show_birthday(args, book: AddressBook):
     name, *_ = args
-    contact = book.find(name)
-    if contact:
-        return f"{contact.name}'s birthday is on {contact.birthday.value}"
-    else:
+    name = sys.intern(name)
+    contact = book.get(name)
+    if contact is None:
         return f"No contact found with name {name}"
+    if contact.birthday is None:
+        return f"No birthday set for {name}"
+    return f"{contact.name}'s birthday is on {contact.birthday.value}"
 
 
 @input_error
@@ -206,49 +246,48 @@ def birthdays(args, book: AddressBook):
         return ["No birthdays this week"]
 
 
+HANDLERS = {
+    "hello": lambda args, book: "How can I help you?",
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phones,
+    "all": lambda args, book: show_all(book),
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
 def parse_input(user_input):
-    parts = user_input.split()
-    command = parts[0]
-    args = parts[1:]
-    return command, args
+    command, sep, rest = user_input.strip().partition(' ')
+    command = command.lower()
+    if not sep:
+        return command, ()
+    return command, tuple(rest.split())
 
 def main():
     book = AddressBook()
-    print("Welcome to the assistant bot!")
+    stdin_readline = sys.stdin.readline
+    out_write = sys.stdout.write
+    out_flush = sys.stdout.flush
+    out_write("Welcome to the assistant bot!\n")
     while True:
-        user_input = input("Enter a command: ")
+        out_write("Enter a command: ")
+        out_flush()
+        user_input = stdin_readline()
+        if not user_input:
+            break
         command, args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
-            print("Good bye!")
+        if command in ("close", "exit"):
+            out_write("Good bye!\n")
             break
 
-        elif command == "hello":
-            print("How can I help you?")
-
-        elif command == "add":
-            print(add_contact(args, book))
-
-        elif command == "change":
-            print(change_contact(args, book))
-
-        elif command == "phone":
-            print(show_phones(args, book))
-
-        elif command == "all":
-            print(show_all(book))
-
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-
-        elif command == "birthdays":
-            print(birthdays(args, book))
-
+        handler = HANDLERS.get(command)
+        if handler is not None:
+            out_write(str(handler(args, book)))
+            out_write("\n")
         else:
-            print("Invalid command.")
+            out_write("Invalid command.\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file